@@ -4,25 +4,64 @@
 from __future__ import annotations
 
 import argparse
+import base64
+import collections
+import concurrent.futures
+import contextlib
 import csv
+import functools
+import gzip
 import hashlib
+import http.client
+import io
+import itertools
 import json
 import logging
+import multiprocessing
 import os
 import random
 import re
 import shutil
 import socket
+import ssl
 import subprocess
 import sys
+import tempfile
+import threading
 import time
 import unicodedata
+import zlib
 from datetime import datetime
 from html import unescape
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib import error, parse, request
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # optional; pages are decoded whole otherwise
+    ijson = None
+
 
 OPENALEX_URL = "https://api.openalex.org/works"
 CROSSREF_URL = "https://api.crossref.org/works"
@@ -32,7 +71,23 @@ OPENREVIEW_ENDPOINTS = (
     "https://api.openreview.net/notes/search",
 )
 
+MIN_YEAR = 1900
+MAX_YEAR = 2100
+
 RETRYABLE_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+HTTP_REDIRECT_STATUS_CODES = {301, 302, 303, 307, 308}
+HTTP_MAX_REDIRECTS = 10
+HTTP_POOL_CONNECTIONS = 8
+HTTP_POOL_MAXSIZE = 32
+HTTP_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+THROTTLE_MAX_INTERVAL = 30.0
+THROTTLE_BACKOFF_FLOOR = 0.5
+THROTTLE_RELAX_FACTOR = 0.9
+HOST_GATE_PERMITS = 4
+HOST_GATE_COOLDOWN = 30.0
+SOURCE_FETCH_WORKERS = 4
+PAGE_PREFETCH_DEPTH = 2
 
 MINERU_BACKEND_CHOICES = (
     "pipeline",
@@ -47,6 +102,16 @@ MINERU_DEFAULT_CMD_CANDIDATES = (
     "/home/jinyilun/anaconda3/envs/pdf/bin/mineru",
 )
 
+PDF_DOWNLOAD_WORKERS = 8
+# MinerU parses are heavyweight (memory/GPU); parallel parsing is opt-in.
+MINERU_PARSE_WORKERS = 1
+PDF_STREAM_CHUNK_BYTES = 64 * 1024
+PDF_MAGIC = b"%PDF-"
+PDF_CONTENT_TYPE_MARKERS = ("pdf", "octet-stream")
+# Download methods whose URLs are PDF endpoints by construction; never HEAD-probed.
+PDF_ENDPOINT_METHODS = {"arxiv", "openreview"}
+OUTPUT_PATH_LOCK = threading.Lock()
+
 
 class CollectError(RuntimeError):
     """Raised when a source response cannot be parsed or used."""
@@ -71,8 +136,166 @@ class HttpResponse:
         self.body = body
 
 
+class StreamingHttpResponse:
+    """HTTP response whose body is read incrementally from a pooled connection."""
+
+    __slots__ = ("status", "url", "headers", "_raw", "_release", "_decoder")
+
+    def __init__(
+        self,
+        status: int,
+        url: str,
+        headers: Dict[str, str],
+        raw: http.client.HTTPResponse,
+        release: Callable[[], None],
+    ):
+        self.status = status
+        self.url = url
+        self.headers = headers
+        self._raw = raw
+        self._release: Optional[Callable[[], None]] = release
+        encoding = (raw.getheader("Content-Encoding") or "").strip().lower()
+        self._decoder = (
+            zlib.decompressobj(32 + zlib.MAX_WBITS) if encoding in {"gzip", "x-gzip", "deflate"} else None
+        )
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        while True:
+            chunk = self._raw.read(chunk_size)
+            if not chunk:
+                # Sized reads return short on a dropped connection instead of raising.
+                if self._raw.length:
+                    raise http.client.IncompleteRead(b"", self._raw.length)
+                break
+            if self._decoder is not None:
+                chunk = self._decoder.decompress(chunk)
+            if chunk:
+                yield chunk
+        if self._decoder is not None:
+            tail = self._decoder.flush()
+            if tail:
+                yield tail
+
+    def close(self) -> None:
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+
+def parse_retry_after(response_headers: Optional[Dict[str, str]]) -> Optional[float]:
+    if not response_headers:
+        return None
+    retry_after = response_headers.get("Retry-After")
+    if not retry_after:
+        return None
+    try:
+        return float(retry_after)
+    except ValueError:
+        return None
+
+
+def decode_content(body: bytes, content_encoding: Optional[str]) -> bytes:
+    encoding = (content_encoding or "").strip().lower()
+    if not body or encoding in {"", "identity"}:
+        return body
+    if encoding in {"gzip", "x-gzip"}:
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send raw deflate streams without the zlib header.
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def loads_json_bytes(body: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # orjson rejects invalid UTF-8; fall through to the lenient decode below.
+            pass
+    return json.loads(body.decode("utf-8", errors="replace"))
+
+
+def iter_json_items(body: bytes, path: str, *, source_url: str) -> Iterator[Any]:
+    """Yield the elements of the array at dotted ``path`` in a JSON object body."""
+    yielded = 0
+    # Only stream bodies that are objects; anything else takes the stdlib path
+    # so it gets the same root-type error.
+    if ijson is not None and body.lstrip()[:1] == b"{":
+        try:
+            for item in ijson.items(io.BytesIO(body), f"{path}.item", use_float=True):
+                yielded += 1
+                yield item
+            return
+        except (ijson.JSONError, UnicodeDecodeError):
+            # e.g. invalid UTF-8, which the stdlib path decodes with replacement;
+            # resume there after the items already yielded.
+            pass
+
+    try:
+        node = loads_json_bytes(body)
+    except json.JSONDecodeError as exc:
+        raise CollectError(f"Invalid JSON from {source_url}: {exc}") from exc
+    if not isinstance(node, dict):
+        raise CollectError(f"Unexpected JSON root type from {source_url}: {type(node)!r}")
+    for part in path.split("."):
+        node = node.get(part) if isinstance(node, dict) else None
+    if isinstance(node, list):
+        yield from itertools.islice(node, yielded, None)
+
+
+@functools.lru_cache(maxsize=256)
+def _host_of(base_url: str) -> str:
+    return parse.urlparse(base_url).netloc.lower()
+
+
+class ForwardProxyConnection(http.client.HTTPConnection):
+    """Plain-HTTP connection to a forward proxy that expects absolute request targets."""
+
+    def __init__(self, host: str, port: int, *, timeout: float, proxy_headers: Dict[str, str]):
+        super().__init__(host, port, timeout=timeout)
+        self.proxy_headers = proxy_headers
+
+
+class HostGate:
+    """Per-host concurrency limit that narrows to one request while rate-limited."""
+
+    def __init__(self, permits: int):
+        self.permits = permits
+        self._limit = permits
+        self._active = 0
+        self._restricted_until = 0.0
+        self._cond = threading.Condition()
+
+    def __enter__(self) -> "HostGate":
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        with self._cond:
+            self._active -= 1
+            self._cond.notify_all()
+
+    def restrict(self, seconds: float) -> None:
+        with self._cond:
+            self._limit = 1
+            self._restricted_until = max(self._restricted_until, time.monotonic() + seconds)
+
+    def record_success(self) -> None:
+        with self._cond:
+            if self._limit < self.permits and time.monotonic() >= self._restricted_until:
+                self._limit = self.permits
+                self._cond.notify_all()
+
+
 class PoliteHttpClient:
-    """HTTP helper with per-host throttling, retries, and timeout."""
+    """HTTP helper with per-host throttling, retries, timeout, and keep-alive pooling."""
 
     def __init__(
         self,
@@ -81,39 +304,81 @@ class PoliteHttpClient:
         retries: int,
         min_interval: float,
         user_agent: str,
+        cache_dir: Optional[Path] = None,
+        cache_ttl: float = HTTP_CACHE_TTL_SECONDS,
     ):
         self.timeout = timeout
         self.retries = retries
         self.min_interval = min_interval
         self.user_agent = user_agent
-        self._last_by_host: Dict[str, float] = {}
-
-    def _throttle(self, url: str) -> None:
-        host = parse.urlparse(url).netloc.lower()
-        now = time.monotonic()
-        previous = self._last_by_host.get(host)
-        if previous is not None:
-            wait_for = self.min_interval - (now - previous)
-            if wait_for > 0:
-                time.sleep(wait_for)
-        self._last_by_host[host] = time.monotonic()
+        self.cache_dir = cache_dir
+        self.cache_ttl = cache_ttl
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+        # host -> (next_ready_at, current_interval); the interval widens on
+        # rate-limit responses and relaxes back towards min_interval on success.
+        self._bucket: Dict[str, Tuple[float, float]] = {}
+        self._throttle_lock = threading.Lock()
+        self._host_gates: Dict[str, HostGate] = {}
+        self._ssl_context = ssl.create_default_context()
+        # (scheme, netloc) -> idle sockets, least recently used host first.
+        self._idle_connections: collections.OrderedDict[
+            Tuple[str, str], List[http.client.HTTPConnection]
+        ] = collections.OrderedDict()
+        self._pool_lock = threading.Lock()
+        # DOI -> PDF candidates found on its landing page, shared by download workers.
+        self.doi_pdf_urls: Dict[str, List[str]] = {}
+        self.doi_pdf_urls_lock = threading.Lock()
+
+    def _throttle(self, host: str) -> None:
+        # Reserve the next slot under the lock, then sleep outside it so
+        # concurrent callers for other hosts are never blocked.
+        with self._throttle_lock:
+            now = time.monotonic()
+            next_ready_at, interval = self._bucket.get(host, (now, self.min_interval))
+            scheduled = max(now, next_ready_at)
+            self._bucket[host] = (scheduled + interval, interval)
+        wait_for = scheduled - time.monotonic()
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+    def _widen_interval(self, host: str, retry_after: Optional[float]) -> None:
+        with self._throttle_lock:
+            now = time.monotonic()
+            next_ready_at, interval = self._bucket.get(host, (now, self.min_interval))
+            interval = min(THROTTLE_MAX_INTERVAL, max(interval * 2, THROTTLE_BACKOFF_FLOOR))
+            if retry_after is not None:
+                next_ready_at = max(next_ready_at, now + retry_after)
+            self._bucket[host] = (next_ready_at, interval)
+
+    def _relax_interval(self, host: str) -> None:
+        with self._throttle_lock:
+            state = self._bucket.get(host)
+            if state is None or state[1] <= self.min_interval:
+                return
+            next_ready_at, interval = state
+            self._bucket[host] = (next_ready_at, max(self.min_interval, interval * THROTTLE_RELAX_FACTOR))
+
+    def _gate_for(self, host: str) -> HostGate:
+        with self._throttle_lock:
+            gate = self._host_gates.get(host)
+            if gate is None:
+                gate = HostGate(HOST_GATE_PERMITS)
+                self._host_gates[host] = gate
+            return gate
 
     def _retry_sleep(self, attempt: int, response_headers: Optional[Dict[str, str]]) -> float:
-        if response_headers:
-            retry_after = response_headers.get("Retry-After")
-            if retry_after:
-                try:
-                    retry_seconds = float(retry_after)
-                    return max(self.min_interval, retry_seconds)
-                except ValueError:
-                    pass
+        retry_seconds = parse_retry_after(response_headers)
+        if retry_seconds is not None:
+            return max(self.min_interval, retry_seconds)
         backoff = 0.9 * (2 ** (attempt - 1))
         jitter = random.uniform(0, 0.35)
         return max(self.min_interval, backoff + jitter)
 
-    def _build_url(self, base_url: str, params: Optional[Dict[str, Any]]) -> str:
+    def _build_url(self, base_url: str, params: Optional[Dict[str, Any]]) -> Tuple[str, str]:
+        host = _host_of(base_url)
         if not params:
-            return base_url
+            return base_url, host
         pairs: List[Tuple[str, str]] = []
         for key, value in params.items():
             if value is None:
@@ -125,9 +390,171 @@ class PoliteHttpClient:
                 pairs.append((key, str(value)))
         query_text = parse.urlencode(pairs, doseq=True)
         if not query_text:
-            return base_url
+            return base_url, host
         glue = "&" if "?" in base_url else "?"
-        return f"{base_url}{glue}{query_text}"
+        return f"{base_url}{glue}{query_text}", host
+
+    def _proxy_for(self, scheme: str, host: str) -> Optional[parse.SplitResult]:
+        proxy_url = request.getproxies().get(scheme)
+        if not proxy_url or request.proxy_bypass(host):
+            return None
+        if "://" not in proxy_url:
+            proxy_url = f"http://{proxy_url}"
+        return parse.urlsplit(proxy_url)
+
+    def _new_connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        target = parse.urlsplit(f"{scheme}://{netloc}")
+        host = target.hostname or netloc
+        port = target.port
+        proxy = self._proxy_for(scheme, host)
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context)
+            return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+        proxy_headers: Dict[str, str] = {}
+        if proxy.username:
+            credentials = f"{parse.unquote(proxy.username)}:{parse.unquote(proxy.password or '')}"
+            token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+            proxy_headers["Proxy-Authorization"] = f"Basic {token}"
+        proxy_host = proxy.hostname or ""
+        # Like urllib, a proxy URL without a port gets the default port of the
+        # connection urllib would open to it: 443 if either side is https.
+        proxy_port = proxy.port or (443 if "https" in {proxy.scheme, scheme} else 80)
+        if scheme == "https":
+            conn = http.client.HTTPSConnection(
+                proxy_host,
+                proxy_port,
+                timeout=self.timeout,
+                context=self._ssl_context,
+            )
+            conn.set_tunnel(host, port, headers=proxy_headers)
+            return conn
+        return ForwardProxyConnection(
+            proxy_host,
+            proxy_port,
+            timeout=self.timeout,
+            proxy_headers=proxy_headers,
+        )
+
+    def _checkout(self, key: Tuple[str, str]) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._pool_lock:
+            idle = self._idle_connections.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._new_connection(*key), False
+
+    def _checkin(self, key: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        evicted: List[http.client.HTTPConnection] = []
+        with self._pool_lock:
+            idle = self._idle_connections.setdefault(key, [])
+            self._idle_connections.move_to_end(key)
+            if len(idle) < HTTP_POOL_MAXSIZE:
+                idle.append(conn)
+            else:
+                evicted.append(conn)
+            # Bound the number of pooled hosts so a long PDF/DOI phase does not
+            # keep one idle socket open for every publisher it ever touched.
+            while len(self._idle_connections) > HTTP_POOL_CONNECTIONS:
+                _, stale = self._idle_connections.popitem(last=False)
+                evicted.extend(stale)
+        for stale_conn in evicted:
+            stale_conn.close()
+
+    def _release(
+        self,
+        key: Tuple[str, str],
+        conn: http.client.HTTPConnection,
+        resp: http.client.HTTPResponse,
+    ) -> None:
+        # Only a fully read response leaves the socket ready for the next request.
+        if resp.isclosed() and not resp.will_close:
+            self._checkin(key, conn)
+        else:
+            conn.close()
+
+    def _send_once(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        *,
+        method: str = "GET",
+        stream: bool = False,
+    ) -> Tuple[http.client.HTTPResponse, Optional[bytes], Optional[Callable[[], None]]]:
+        parts = parse.urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.netloc:
+            raise error.URLError(f"unsupported URL: {url}")
+        key = (parts.scheme, parts.netloc.lower())
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        while True:
+            conn, reused = self._checkout(key)
+            send_target = target
+            send_headers = headers
+            if isinstance(conn, ForwardProxyConnection):
+                send_target = parse.urlunsplit((parts.scheme, parts.netloc, target, "", ""))
+                send_headers = {**headers, **conn.proxy_headers}
+            try:
+                conn.request(method, send_target, headers=send_headers)
+                resp = conn.getresponse()
+                if stream and 200 <= resp.status < 300:
+                    # Leave the body on the socket; the caller releases the connection.
+                    return resp, None, functools.partial(self._release, key, conn, resp)
+                body = resp.read()
+            except (http.client.HTTPException, OSError) as exc:
+                conn.close()
+                stale = isinstance(
+                    exc,
+                    (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError),
+                )
+                if reused and stale:
+                    # The server dropped an idle keep-alive socket; retry on a fresh one.
+                    continue
+                if isinstance(exc, (socket.timeout, TimeoutError)):
+                    raise
+                raise error.URLError(exc) from exc
+
+            self._release(key, conn, resp)
+            try:
+                body = decode_content(body, resp.getheader("Content-Encoding"))
+            except (OSError, EOFError, zlib.error) as exc:
+                raise error.URLError(f"undecodable response body: {exc}") from exc
+            return resp, body, None
+
+    def _open(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        *,
+        method: str = "GET",
+        stream: bool = False,
+    ) -> Union[HttpResponse, StreamingHttpResponse]:
+        current_url = url
+        for _ in range(HTTP_MAX_REDIRECTS + 1):
+            resp, body, release = self._send_once(current_url, headers, method=method, stream=stream)
+            if release is not None:
+                return StreamingHttpResponse(
+                    status=int(resp.status),
+                    url=current_url,
+                    headers={k: v for k, v in resp.getheaders()},
+                    raw=resp,
+                    release=release,
+                )
+            location = resp.getheader("Location")
+            if resp.status in HTTP_REDIRECT_STATUS_CODES and location:
+                current_url = parse.urljoin(current_url, location)
+                continue
+            if resp.status >= 400:
+                raise error.HTTPError(current_url, resp.status, resp.reason, resp.msg, io.BytesIO(body or b""))
+            return HttpResponse(
+                status=int(resp.status or 200),
+                url=current_url,
+                headers={k: v for k, v in resp.getheaders()},
+                body=body or b"",
+            )
+        raise error.URLError(f"too many redirects: {url}")
 
     def request(
         self,
@@ -135,28 +562,86 @@ class PoliteHttpClient:
         *,
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
+        method: str = "GET",
     ) -> HttpResponse:
-        url = self._build_url(base_url, params)
+        url, host = self._build_url(base_url, params)
+        merged_headers = {"User-Agent": self.user_agent, "Accept-Encoding": "gzip, deflate"}
+        if headers:
+            merged_headers.update(headers)
+
+        gate = self._gate_for(host)
+        with gate:
+            return self._with_retries(url, host, gate, lambda: self._open(url, merged_headers, method=method))
+
+    @contextlib.contextmanager
+    def stream(
+        self,
+        base_url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Iterator[StreamingHttpResponse]:
+        url, host = self._build_url(base_url, params)
+        # No Accept-Encoding: streamed payloads (PDFs) are already compressed.
         merged_headers = {"User-Agent": self.user_agent}
         if headers:
             merged_headers.update(headers)
 
+        gate = self._gate_for(host)
+        with gate:
+            response = self._with_retries(url, host, gate, lambda: self._open(url, merged_headers, stream=True))
+            try:
+                yield response
+            finally:
+                response.close()
+
+    def consume_stream(
+        self,
+        base_url: str,
+        consume: Callable[[StreamingHttpResponse], Any],
+        *,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        # stream() only retries until the headers arrive; a body that dies
+        # part-way through is re-fetched from the start here.
         for attempt in range(1, self.retries + 1):
-            self._throttle(url)
-            req = request.Request(url, headers=merged_headers)
+            opened = False
             try:
-                with request.urlopen(req, timeout=self.timeout) as resp:
-                    body = resp.read()
-                    response_headers = {k: v for k, v in resp.headers.items()}
-                    return HttpResponse(
-                        status=int(resp.getcode() or 200),
-                        url=resp.geturl(),
-                        headers=response_headers,
-                        body=body,
-                    )
+                with self.stream(base_url, headers=headers) as response:
+                    opened = True
+                    return consume(response)
+            except (http.client.IncompleteRead, socket.timeout, OSError) as exc:
+                if not opened or attempt >= self.retries:
+                    raise
+                sleep_for = self._retry_sleep(attempt, None)
+                logging.warning(
+                    "Body read failed for %s (%s, attempt %d/%d), retrying in %.2fs",
+                    base_url,
+                    exc,
+                    attempt,
+                    self.retries,
+                    sleep_for,
+                )
+                time.sleep(sleep_for)
+        raise CollectError(f"Request retries exhausted: {base_url}")
+
+    def _with_retries(self, url: str, host: str, gate: HostGate, send: Callable[[], Any]) -> Any:
+        for attempt in range(1, self.retries + 1):
+            self._throttle(host)
+            try:
+                response = send()
             except error.HTTPError as exc:
                 status_code = int(exc.code)
                 response_headers = {k: v for k, v in exc.headers.items()} if exc.headers else {}
+                retry_after = parse_retry_after(response_headers)
+                # _open follows redirects, so the error may come from another host;
+                # only push back on the host this request is throttled and gated on.
+                from_host = _host_of(exc.url) == host
+                if from_host and (status_code == 429 or retry_after is not None):
+                    self._widen_interval(host, retry_after)
+                if from_host and status_code in RETRYABLE_STATUS_CODES:
+                    # Let only one request at a time probe a host that is pushing back.
+                    gate.restrict(max(HOST_GATE_COOLDOWN, retry_after or 0.0))
                 if status_code in RETRYABLE_STATUS_CODES and attempt < self.retries:
                     sleep_for = self._retry_sleep(attempt, response_headers)
                     logging.warning(
@@ -184,6 +669,10 @@ class PoliteHttpClient:
                     time.sleep(sleep_for)
                     continue
                 raise
+            else:
+                self._relax_interval(host)
+                gate.record_success()
+                return response
 
         raise CollectError(f"Request retries exhausted: {url}")
 
@@ -194,19 +683,63 @@ class PoliteHttpClient:
         params: Optional[Dict[str, Any]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Dict[str, Any]:
-        merged_headers = {"Accept": "application/json"}
-        if headers:
-            merged_headers.update(headers)
-        response = self.request(base_url, params=params, headers=merged_headers)
-        payload_text = response.body.decode("utf-8", errors="replace")
+        body = self.get_json_body(base_url, params=params, headers=headers)
         try:
-            parsed = json.loads(payload_text)
+            parsed = loads_json_bytes(body)
         except json.JSONDecodeError as exc:
             raise CollectError(f"Invalid JSON from {base_url}: {exc}") from exc
         if not isinstance(parsed, dict):
             raise CollectError(f"Unexpected JSON root type from {base_url}: {type(parsed)!r}")
         return parsed
 
+    def get_json_body(
+        self,
+        base_url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> bytes:
+        cache_path = self._cache_path(base_url, params)
+        if cache_path is not None:
+            cached = self._read_cache(cache_path)
+            if cached is not None:
+                return cached
+        merged_headers = {"Accept": "application/json"}
+        if headers:
+            merged_headers.update(headers)
+        body = self.request(base_url, params=params, headers=merged_headers).body
+        if cache_path is not None and body.lstrip()[:1] == b"{":
+            self._write_cache(cache_path, body)
+        return body
+
+    def _cache_path(self, base_url: str, params: Optional[Dict[str, Any]]) -> Optional[Path]:
+        if self.cache_dir is None:
+            return None
+        pairs = sorted((str(key), str(value)) for key, value in (params or {}).items() if value is not None)
+        key_text = f"{base_url}?{parse.urlencode(pairs)}"
+        digest = hashlib.blake2b(key_text.encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.json.gz"
+
+    def _read_cache(self, cache_path: Path) -> Optional[bytes]:
+        try:
+            if time.time() - cache_path.stat().st_mtime > self.cache_ttl:
+                return None
+            return gzip.decompress(cache_path.read_bytes())
+        except (OSError, EOFError, zlib.error):
+            return None
+
+    def _write_cache(self, cache_path: Path, body: bytes) -> None:
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=cache_path.parent,
+                prefix=f".{cache_path.name}.",
+                delete=False,
+            ) as handle:
+                handle.write(gzip.compress(body))
+            os.replace(handle.name, cache_path)
+        except OSError as exc:
+            logging.debug("HTTP cache write failed for %s: %s", cache_path, exc)
+
 
 def parse_csv_list(text: str) -> List[str]:
     if not text:
@@ -230,14 +763,14 @@ def parse_years(text: str) -> Optional[Set[int]]:
         else:
             years.add(int(block))
 
-    invalid = sorted(year for year in years if year < 1900 or year > 2100)
+    invalid = sorted(year for year in years if year < MIN_YEAR or year > MAX_YEAR)
     if invalid:
         raise ValueError(f"years out of range: {invalid}")
     return years
 
 
 def normalize_whitespace(text: str) -> str:
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
 
 
 def clipped_text(text: Optional[str], limit: int = 2000) -> str:
@@ -255,20 +788,25 @@ def decode_process_text(value: Any) -> str:
     return str(value)
 
 
+NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _fold_ascii_key(text: str) -> str:
+    folded = unicodedata.normalize("NFKD", unescape(text or ""))
+    folded = folded.encode("ascii", "ignore").decode("ascii")
+    # NON_ALNUM_RE collapses every run of separators to one space, so no extra
+    # whitespace pass is needed afterwards.
+    return NON_ALNUM_RE.sub(" ", folded.lower()).strip()
+
+
+@functools.lru_cache(maxsize=8192)
 def normalize_title(text: str) -> str:
-    normalized = unicodedata.normalize("NFKD", unescape(text or ""))
-    normalized = normalized.encode("ascii", "ignore").decode("ascii", errors="ignore")
-    normalized = normalized.lower()
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
-    return normalize_whitespace(normalized)
+    return _fold_ascii_key(text)
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_venue(text: str) -> str:
-    normalized = unicodedata.normalize("NFKD", unescape(text or ""))
-    normalized = normalized.encode("ascii", "ignore").decode("ascii", errors="ignore")
-    normalized = normalized.lower()
-    normalized = re.sub(r"[^a-z0-9]+", " ", normalized)
-    return normalize_whitespace(normalized)
+    return _fold_ascii_key(text)
 
 
 CANONICAL_VENUE_MARKER_PREFIX = "__canonical_venue__:"
@@ -384,6 +922,11 @@ def _build_canonical_venue_alias_map() -> Dict[str, str]:
 
 CANONICAL_VENUE_ALIAS_MAP = _build_canonical_venue_alias_map()
 
+CANONICAL_RULE_SETS: Dict[str, Tuple[FrozenSet[str], ...]] = {
+    canonical_name: tuple(frozenset(token_group) for token_group in token_rules)
+    for canonical_name, token_rules in CANONICAL_VENUE_TOKEN_RULES.items()
+}
+
 
 def canonical_venue_marker(canonical_name: str) -> str:
     return f"{CANONICAL_VENUE_MARKER_PREFIX}{canonical_name}"
@@ -422,24 +965,48 @@ def normalize_requested_venue_terms(raw_terms: Sequence[str]) -> List[str]:
     return output
 
 
-def venue_matches_canonical_alias(venue_tokens: Set[str], canonical_name: str) -> bool:
-    token_rules = CANONICAL_VENUE_TOKEN_RULES.get(canonical_name, ())
-    for token_group in token_rules:
-        if all(token in venue_tokens for token in token_group):
-            return True
-    return False
+@functools.lru_cache(maxsize=2048)
+def _venue_key(raw_venue: str) -> Tuple[str, FrozenSet[str]]:
+    venue = normalize_venue(raw_venue)
+    return venue, frozenset(venue.split())
+
+
+def venue_matches_canonical_alias(venue_tokens: AbstractSet[str], canonical_name: str) -> bool:
+    return any(rule <= venue_tokens for rule in CANONICAL_RULE_SETS.get(canonical_name, ()))
+
 
+VenueFilter = Tuple[FrozenSet[str], Tuple[str, ...]]
 
-def venue_term_matches(venue: str, venue_tokens: Set[str], term: str) -> bool:
-    canonical_name = parse_canonical_venue_marker(term)
-    if canonical_name is not None:
-        return venue_matches_canonical_alias(venue_tokens, canonical_name)
-    return term in venue or venue in term
+
+def compile_venue_filter(venue_terms: Sequence[str]) -> VenueFilter:
+    canonical_names: Set[str] = set()
+    substring_terms: List[str] = []
+    for term in venue_terms:
+        canonical_name = parse_canonical_venue_marker(term)
+        if canonical_name is not None:
+            canonical_names.add(canonical_name)
+        else:
+            substring_terms.append(term)
+    return frozenset(canonical_names), tuple(substring_terms)
+
+
+@functools.lru_cache(maxsize=2048)
+def _matched_canonicals_for(venue_tokens: FrozenSet[str]) -> FrozenSet[str]:
+    return frozenset(
+        canonical_name
+        for canonical_name in CANONICAL_RULE_SETS
+        if venue_matches_canonical_alias(venue_tokens, canonical_name)
+    )
 
 
+# Identifier/URL/abstract normalizers are pure functions of one string that
+# repeat across pages and sources, so they share a bounded memo size.
+NORMALIZE_CACHE_SIZE = 8192
+
 DOI_PREFIX_RE = re.compile(r"^https?://(?:dx\.)?doi\.org/", re.IGNORECASE)
 
 
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_doi(raw_doi: Optional[str]) -> Optional[str]:
     if not raw_doi:
         return None
@@ -453,14 +1020,17 @@ def normalize_doi(raw_doi: Optional[str]) -> Optional[str]:
     return doi
 
 
-ARXIV_PATTERNS = (
-    re.compile(r"arxiv\.org/(?:abs|pdf)/([^/?#]+)", re.IGNORECASE),
-    re.compile(r"\barxiv:\s*([^\s]+)", re.IGNORECASE),
-    re.compile(r"\b([0-9]{4}\.[0-9]{4,5}(?:v\d+)?)\b", re.IGNORECASE),
-    re.compile(r"\b([a-z\-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)\b", re.IGNORECASE),
+ARXIV_ID_RE = re.compile(
+    r"arxiv\.org/(?:abs|pdf)/(?P<url>[^/?#]+)"
+    r"|\barxiv:\s*(?P<prefixed>[^\s]+)"
+    r"|\b(?P<modern>[0-9]{4}\.[0-9]{4,5}(?:v\d+)?)\b"
+    r"|\b(?P<legacy>[a-z\-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)\b",
+    re.IGNORECASE,
 )
+ARXIV_VERSION_RE = re.compile(r"v\d+$")
 
 
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def normalize_arxiv_id(raw_arxiv: Optional[str]) -> Optional[str]:
     if not raw_arxiv:
         return None
@@ -473,18 +1043,19 @@ def normalize_arxiv_id(raw_arxiv: Optional[str]) -> Optional[str]:
     if not candidate:
         return None
 
-    matched = None
-    for pattern in ARXIV_PATTERNS:
-        found = pattern.search(candidate)
-        if found:
-            matched = found.group(1)
-            break
-
-    if matched is None:
+    found = ARXIV_ID_RE.search(candidate)
+    if found:
+        matched = (
+            found.group("url")
+            or found.group("prefixed")
+            or found.group("modern")
+            or found.group("legacy")
+        )
+    else:
         matched = candidate
 
     matched = matched.strip().lower()
-    matched = re.sub(r"v\d+$", "", matched)
+    matched = ARXIV_VERSION_RE.sub("", matched)
     if not matched:
         return None
     return matched
@@ -503,11 +1074,12 @@ def coerce_year(value: Any) -> Optional[int]:
         year = int(value)
     except (TypeError, ValueError):
         return None
-    if 1900 <= year <= 2100:
+    if MIN_YEAR <= year <= MAX_YEAR:
         return year
     return None
 
 
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def clean_url(url: Optional[str]) -> Optional[str]:
     if not url:
         return None
@@ -520,6 +1092,7 @@ def clean_url(url: Optional[str]) -> Optional[str]:
     return cleaned
 
 
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def is_probably_pdf_url(url: str) -> bool:
     lowered = url.lower()
     if lowered.endswith(".pdf"):
@@ -531,11 +1104,16 @@ def is_probably_pdf_url(url: str) -> bool:
     return False
 
 
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+
+@functools.lru_cache(maxsize=NORMALIZE_CACHE_SIZE)
 def strip_html_tags(text: Optional[str]) -> Optional[str]:
     if not text:
         return None
-    cleaned = re.sub(r"<[^>]+>", " ", text)
-    return normalize_whitespace(unescape(cleaned))
+    if "<" not in text:
+        return normalize_whitespace(unescape(text))
+    return normalize_whitespace(unescape(HTML_TAG_RE.sub(" ", text)))
 
 
 def normalize_authors(authors: Iterable[str]) -> List[str]:
@@ -553,8 +1131,7 @@ def normalize_authors(authors: Iterable[str]) -> List[str]:
     return output
 
 
-def append_unique(items: List[str], values: Iterable[str]) -> None:
-    seen = set(items)
+def append_unique(items: List[str], seen: Set[str], values: Iterable[str]) -> None:
     for value in values:
         if not value:
             continue
@@ -564,33 +1141,56 @@ def append_unique(items: List[str], values: Iterable[str]) -> None:
         seen.add(value)
 
 
+def years_to_mask(years: Optional[Set[int]]) -> Optional[int]:
+    if years is None:
+        return None
+    mask = 0
+    for year in years:
+        mask |= 1 << (year - MIN_YEAR)
+    return mask
+
+
 def paper_passes_filters(
     paper: Dict[str, Any],
     *,
-    venue_terms: Sequence[str],
-    years: Optional[Set[int]],
+    venue_filter: VenueFilter,
+    years_mask: Optional[int],
 ) -> bool:
-    if years is not None:
-        paper_year = coerce_year(paper.get("year"))
-        if paper_year is None or paper_year not in years:
+    if years_mask is not None:
+        # Parsed papers already carry coerce_year() output: an int or None.
+        paper_year = paper.get("year")
+        if not isinstance(paper_year, int) or not MIN_YEAR <= paper_year <= MAX_YEAR:
+            return False
+        if not (years_mask >> (paper_year - MIN_YEAR)) & 1:
             return False
 
-    if venue_terms:
-        venue = normalize_venue(str(paper.get("venue") or ""))
+    canonical_names, substring_terms = venue_filter
+    if canonical_names or substring_terms:
+        venue, venue_tokens = _venue_key(str(paper.get("venue") or ""))
         if not venue:
             return False
-        venue_tokens = set(venue.split())
-        matched = False
-        for term in venue_terms:
-            if venue_term_matches(venue, venue_tokens, term):
-                matched = True
-                break
-        if not matched:
-            return False
+        if canonical_names & _matched_canonicals_for(venue_tokens):
+            return True
+        for term in substring_terms:
+            if term in venue or venue in term:
+                return True
+        return False
 
     return True
 
 
+def is_repeat_in_source(paper: Dict[str, Any], seen: Set[Tuple[str, str]]) -> bool:
+    # Repeated records inside one source would only eat into max_per_source;
+    # cross-source merging still happens in deduplicate_papers. Only the
+    # strongest key is compared, so records with differing identifiers still
+    # reach the merge step with their pdf_urls and source ids.
+    key = dedup_keys({**paper, "title_norm": normalize_title(str(paper.get("title") or ""))})[0]
+    if key in seen:
+        return True
+    seen.add(key)
+    return False
+
+
 def parse_openalex_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     title = item.get("display_name") or item.get("title")
     if not title:
@@ -617,18 +1217,20 @@ def parse_openalex_item(item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     if arxiv_id is None:
         arxiv_id = extract_arxiv_id(landing_url)
 
+    # OpenAlex repeats the primary/OA PDF across most locations; skip raw
+    # repeats before cleaning and keep the list duplicate-free.
     pdf_urls: List[str] = []
-    for candidate in (
-        (item.get("open_access") or {}).get("oa_url"),
-        primary_location.get("pdf_url"),
-    ):
+    pdf_seen: Set[str] = set()
+    candidates = itertools.chain(
+        ((item.get("open_access") or {}).get("oa_url"), primary_location.get("pdf_url")),
+        ((location or {}).get("pdf_url") for location in item.get("locations") or []),
+    )
+    for candidate in candidates:
+        if not candidate or candidate in pdf_seen:
+            continue
         cleaned = clean_url(candidate)
-        if cleaned:
-            pdf_urls.append(cleaned)
-
-    for location in item.get("locations") or []:
-        cleaned = clean_url((location or {}).get("pdf_url"))
-        if cleaned:
+        if cleaned and cleaned not in pdf_seen:
+            pdf_seen.add(cleaned)
             pdf_urls.append(cleaned)
 
     return {
@@ -742,6 +1344,31 @@ def openreview_content_value(content: Dict[str, Any], key: str) -> Any:
     return value
 
 
+def openreview_year(item: Dict[str, Any], content: Dict[str, Any]) -> Optional[int]:
+    year = coerce_year(openreview_content_value(content, "year"))
+    if year is None:
+        cdate = item.get("cdate")
+        if isinstance(cdate, (int, float)) and cdate > 0:
+            year = datetime.utcfromtimestamp(cdate / 1000.0).year
+    return year
+
+
+def raw_openreview_passes(
+    item: Dict[str, Any],
+    *,
+    venue_filter: VenueFilter,
+    years_mask: Optional[int],
+) -> bool:
+    # Reads only the fields paper_passes_filters looks at, exactly as
+    # parse_openreview_item derives them, so rejected notes are never parsed.
+    content = item.get("content") or {}
+    candidate = {
+        "year": openreview_year(item, content),
+        "venue": str(openreview_content_value(content, "venue") or ""),
+    }
+    return paper_passes_filters(candidate, venue_filter=venue_filter, years_mask=years_mask)
+
+
 def parse_openreview_item(item: Dict[str, Any], endpoint: str) -> Optional[Dict[str, Any]]:
     content = item.get("content") or {}
     title = openreview_content_value(content, "title")
@@ -754,13 +1381,7 @@ def parse_openreview_item(item: Dict[str, Any], endpoint: str) -> Optional[Dict[
     authors = [str(author) for author in (authors_value or []) if author]
 
     venue_value = openreview_content_value(content, "venue") or ""
-
-    year_value = openreview_content_value(content, "year")
-    year = coerce_year(year_value)
-    if year is None:
-        cdate = item.get("cdate")
-        if isinstance(cdate, (int, float)) and cdate > 0:
-            year = datetime.utcfromtimestamp(cdate / 1000.0).year
+    year = openreview_year(item, content)
 
     abstract = openreview_content_value(content, "abstract")
     doi = normalize_doi(openreview_content_value(content, "doi"))
@@ -793,6 +1414,53 @@ def parse_openreview_item(item: Dict[str, Any], endpoint: str) -> Optional[Dict[
     }
 
 
+def iter_page_bodies(
+    client: PoliteHttpClient,
+    base_url: str,
+    page_params: Iterable[Dict[str, Any]],
+    *,
+    headers: Optional[Dict[str, str]] = None,
+    prefetch_pages: int = PAGE_PREFETCH_DEPTH,
+    quota_pages: Optional[int] = None,
+) -> Iterator[bytes]:
+    """Yield raw JSON page bodies in order, keeping up to ``prefetch_pages`` requests in flight."""
+    params_iter = iter(page_params)
+    depth = max(1, prefetch_pages)
+    pool = concurrent.futures.ThreadPoolExecutor(max_workers=depth)
+    pending: Deque[concurrent.futures.Future] = collections.deque()
+    submitted = 0
+
+    def submit_next() -> bool:
+        nonlocal submitted
+        params = next(params_iter, None)
+        if params is None:
+            return False
+        pending.append(pool.submit(client.get_json_body, base_url, params=params, headers=headers))
+        submitted += 1
+        return True
+
+    submit_next()
+    full_pages = 0
+    try:
+        while pending:
+            yield pending.popleft().result()
+            # The caller only resumes after a full page with quota left, which is
+            # exactly when a sequential crawl would request the next page. Only
+            # then widen the window, one page per full page and never past the
+            # pages the quota can use, so short result sets cost no extra calls.
+            full_pages += 1
+            if not pending:
+                submit_next()
+            while (
+                len(pending) < min(depth, full_pages)
+                and (quota_pages is None or submitted < quota_pages)
+                and submit_next()
+            ):
+                pass
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 def fetch_openalex(
     client: PoliteHttpClient,
     *,
@@ -800,43 +1468,52 @@ def fetch_openalex(
     max_per_source: int,
     venue_terms: Sequence[str],
     years: Optional[Set[int]],
+    prefetch_pages: int = PAGE_PREFETCH_DEPTH,
 ) -> List[Dict[str, Any]]:
+    venue_filter = compile_venue_filter(venue_terms)
+    years_mask = years_to_mask(years)
     papers: List[Dict[str, Any]] = []
+    seen: Set[Tuple[str, str]] = set()
     year_batches = sorted(years) if years else [None]
 
     for year in year_batches:
-        page = 1
-        while len(papers) < max_per_source:
-            remaining = max_per_source - len(papers)
-            per_page = min(200, remaining)
-            params: Dict[str, Any] = {"search": query, "per-page": per_page, "page": page}
-            filters: List[str] = []
-            if year is not None:
-                filters.append(f"from_publication_date:{year}-01-01")
-                filters.append(f"to_publication_date:{year}-12-31")
-            if filters:
-                params["filter"] = ",".join(filters)
-
-            payload = client.get_json(OPENALEX_URL, params=params)
-            results = payload.get("results") or []
-            if not isinstance(results, list) or not results:
-                break
-
-            for item in results:
+        # Keep one page size per batch so speculative page numbers stay aligned.
+        per_page = min(200, max_per_source - len(papers))
+        filters: List[str] = []
+        if year is not None:
+            filters.append(f"from_publication_date:{year}-01-01")
+            filters.append(f"to_publication_date:{year}-12-31")
+        base_params: Dict[str, Any] = {"search": query, "per-page": per_page}
+        if filters:
+            base_params["filter"] = ",".join(filters)
+        page_params = ({**base_params, "page": page} for page in itertools.count(1))
+        quota_pages = -(-(max_per_source - len(papers)) // per_page)
+
+        for body in iter_page_bodies(
+            client,
+            OPENALEX_URL,
+            page_params,
+            prefetch_pages=prefetch_pages,
+            quota_pages=quota_pages,
+        ):
+            page_size = 0
+            for item in iter_json_items(body, "results", source_url=OPENALEX_URL):
+                page_size += 1
                 if not isinstance(item, dict):
                     continue
                 paper = parse_openalex_item(item)
                 if not paper:
                     continue
-                if not paper_passes_filters(paper, venue_terms=venue_terms, years=years):
+                if not paper_passes_filters(paper, venue_filter=venue_filter, years_mask=years_mask):
+                    continue
+                if is_repeat_in_source(paper, seen):
                     continue
                 papers.append(paper)
                 if len(papers) >= max_per_source:
                     break
 
-            if len(results) < per_page:
+            if len(papers) >= max_per_source or page_size < per_page:
                 break
-            page += 1
 
         if len(papers) >= max_per_source:
             break
@@ -851,51 +1528,54 @@ def fetch_crossref(
     max_per_source: int,
     venue_terms: Sequence[str],
     years: Optional[Set[int]],
+    prefetch_pages: int = PAGE_PREFETCH_DEPTH,
 ) -> List[Dict[str, Any]]:
+    venue_filter = compile_venue_filter(venue_terms)
+    years_mask = years_to_mask(years)
     papers: List[Dict[str, Any]] = []
+    seen: Set[Tuple[str, str]] = set()
     year_batches = sorted(years) if years else [None]
     mailto = os.getenv("CROSSREF_MAILTO", "")
 
     for year in year_batches:
-        offset = 0
-        while len(papers) < max_per_source:
-            remaining = max_per_source - len(papers)
-            rows = min(100, remaining)
-            params: Dict[str, Any] = {
-                "query.bibliographic": query,
-                "rows": rows,
-                "offset": offset,
-            }
-            filters: List[str] = []
-            if year is not None:
-                filters.append(f"from-pub-date:{year}-01-01")
-                filters.append(f"until-pub-date:{year}-12-31")
-            if filters:
-                params["filter"] = ",".join(filters)
-            if mailto:
-                params["mailto"] = mailto
-
-            payload = client.get_json(CROSSREF_URL, params=params)
-            message = payload.get("message") or {}
-            items = message.get("items") or []
-            if not isinstance(items, list) or not items:
-                break
-
-            for item in items:
+        rows = min(100, max_per_source - len(papers))
+        base_params: Dict[str, Any] = {"query.bibliographic": query, "rows": rows}
+        filters: List[str] = []
+        if year is not None:
+            filters.append(f"from-pub-date:{year}-01-01")
+            filters.append(f"until-pub-date:{year}-12-31")
+        if filters:
+            base_params["filter"] = ",".join(filters)
+        if mailto:
+            base_params["mailto"] = mailto
+        page_params = ({**base_params, "offset": offset} for offset in itertools.count(0, rows))
+        quota_pages = -(-(max_per_source - len(papers)) // rows)
+
+        for body in iter_page_bodies(
+            client,
+            CROSSREF_URL,
+            page_params,
+            prefetch_pages=prefetch_pages,
+            quota_pages=quota_pages,
+        ):
+            page_size = 0
+            for item in iter_json_items(body, "message.items", source_url=CROSSREF_URL):
+                page_size += 1
                 if not isinstance(item, dict):
                     continue
                 paper = parse_crossref_item(item)
                 if not paper:
                     continue
-                if not paper_passes_filters(paper, venue_terms=venue_terms, years=years):
+                if not paper_passes_filters(paper, venue_filter=venue_filter, years_mask=years_mask):
+                    continue
+                if is_repeat_in_source(paper, seen):
                     continue
                 papers.append(paper)
                 if len(papers) >= max_per_source:
                     break
 
-            if len(items) < rows:
+            if len(papers) >= max_per_source or page_size < rows:
                 break
-            offset += rows
 
         if len(papers) >= max_per_source:
             break
@@ -910,43 +1590,51 @@ def fetch_semantic_scholar(
     max_per_source: int,
     venue_terms: Sequence[str],
     years: Optional[Set[int]],
+    prefetch_pages: int = PAGE_PREFETCH_DEPTH,
 ) -> List[Dict[str, Any]]:
+    venue_filter = compile_venue_filter(venue_terms)
+    years_mask = years_to_mask(years)
     papers: List[Dict[str, Any]] = []
+    seen: Set[Tuple[str, str]] = set()
     headers: Dict[str, str] = {}
     api_key = os.getenv("SEMANTIC_SCHOLAR_API_KEY", "").strip()
     if api_key:
         headers["x-api-key"] = api_key
 
-    offset = 0
-    while len(papers) < max_per_source:
-        remaining = max_per_source - len(papers)
-        limit = min(100, remaining)
-        params = {
-            "query": query,
-            "offset": offset,
-            "limit": limit,
-            "fields": "paperId,title,abstract,year,venue,publicationVenue,externalIds,url,openAccessPdf,authors",
-        }
-        payload = client.get_json(SEMANTIC_SCHOLAR_URL, params=params, headers=headers)
-        data = payload.get("data") or []
-        if not isinstance(data, list) or not data:
-            break
+    limit = min(100, max_per_source)
+    base_params: Dict[str, Any] = {
+        "query": query,
+        "limit": limit,
+        "fields": "paperId,title,abstract,year,venue,publicationVenue,externalIds,url,openAccessPdf,authors",
+    }
+    page_params = ({**base_params, "offset": offset} for offset in itertools.count(0, limit))
 
-        for item in data:
+    for body in iter_page_bodies(
+        client,
+        SEMANTIC_SCHOLAR_URL,
+        page_params,
+        headers=headers,
+        prefetch_pages=prefetch_pages,
+        quota_pages=-(-max_per_source // limit),
+    ):
+        page_size = 0
+        for item in iter_json_items(body, "data", source_url=SEMANTIC_SCHOLAR_URL):
+            page_size += 1
             if not isinstance(item, dict):
                 continue
             paper = parse_semantic_scholar_item(item)
             if not paper:
                 continue
-            if not paper_passes_filters(paper, venue_terms=venue_terms, years=years):
+            if not paper_passes_filters(paper, venue_filter=venue_filter, years_mask=years_mask):
+                continue
+            if is_repeat_in_source(paper, seen):
                 continue
             papers.append(paper)
             if len(papers) >= max_per_source:
                 break
 
-        if len(data) < limit:
+        if len(papers) >= max_per_source or page_size < limit:
             break
-        offset += limit
 
     return papers
 
@@ -959,8 +1647,12 @@ def fetch_openreview(
     venue_terms: Sequence[str],
     years: Optional[Set[int]],
 ) -> List[Dict[str, Any]]:
+    venue_filter = compile_venue_filter(venue_terms)
+    years_mask = years_to_mask(years)
+    filtering = years_mask is not None or any(venue_filter)
     for endpoint in OPENREVIEW_ENDPOINTS:
         papers: List[Dict[str, Any]] = []
+        seen: Set[Tuple[str, str]] = set()
         offset = 0
         endpoint_ok = False
         while len(papers) < max_per_source:
@@ -987,10 +1679,16 @@ def fetch_openreview(
             for item in notes:
                 if not isinstance(item, dict):
                     continue
+                if filtering and not raw_openreview_passes(
+                    item,
+                    venue_filter=venue_filter,
+                    years_mask=years_mask,
+                ):
+                    continue
                 paper = parse_openreview_item(item, endpoint)
                 if not paper:
                     continue
-                if not paper_passes_filters(paper, venue_terms=venue_terms, years=years):
+                if is_repeat_in_source(paper, seen):
                     continue
                 papers.append(paper)
                 if len(papers) >= max_per_source:
@@ -1046,8 +1744,9 @@ def canonicalize_raw_paper(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         "pdf_urls": [],
         "sources": [source],
         "source_ids": {},
+        "_seen": {"authors": set(authors), "pdf_urls": set(), "sources": {source}},
     }
-    append_unique(canonical["pdf_urls"], pdf_urls)
+    append_unique(canonical["pdf_urls"], canonical["_seen"]["pdf_urls"], pdf_urls)
     if source_id:
         canonical["source_ids"][source] = str(source_id)
     return canonical
@@ -1062,11 +1761,12 @@ def dedup_keys(paper: Dict[str, Any]) -> List[Tuple[str, str]]:
     if paper.get("title_norm"):
         keys.append(("title", str(paper["title_norm"])))
     if not keys:
-        fallback = hashlib.sha1(
+        fallback = hashlib.blake2b(
             f"{paper.get('title','')}|{paper.get('url','')}|{paper.get('sources','')}".encode(
                 "utf-8",
                 errors="ignore",
-            )
+            ),
+            digest_size=8,
         ).hexdigest()
         keys.append(("fallback", fallback))
     return keys
@@ -1080,18 +1780,31 @@ def better_text(current: Optional[str], candidate: Optional[str]) -> Optional[st
     return candidate if len(candidate) > len(current) else current
 
 
+MERGED_LIST_FIELDS = ("authors", "pdf_urls", "sources")
+CANONICALIZE_PARALLEL_MIN_PAPERS = 5000
+CANONICALIZE_CHUNK_SIZE = 64
+
+
 def merge_papers(target: Dict[str, Any], incoming: Dict[str, Any]) -> None:
-    target["title"] = better_text(target.get("title"), incoming.get("title")) or ""
-    target["title_norm"] = normalize_title(target.get("title") or "")
-    target["venue"] = better_text(target.get("venue"), incoming.get("venue")) or ""
-    target["abstract"] = better_text(target.get("abstract"), incoming.get("abstract"))
+    # Duplicates across sources often repeat the same fields, so each update
+    # is skipped when the incoming value cannot change the target.
+    incoming_title = incoming.get("title")
+    if incoming_title and incoming_title != target.get("title"):
+        title = better_text(target.get("title"), incoming_title) or ""
+        if title != target.get("title"):
+            target["title"] = title
+            target["title_norm"] = normalize_title(title)
+    incoming_venue = incoming.get("venue")
+    if incoming_venue and incoming_venue != target.get("venue"):
+        target["venue"] = better_text(target.get("venue"), incoming_venue) or ""
+    incoming_abstract = incoming.get("abstract")
+    if incoming_abstract and incoming_abstract != target.get("abstract"):
+        target["abstract"] = better_text(target.get("abstract"), incoming_abstract)
 
-    target_year = coerce_year(target.get("year"))
     incoming_year = coerce_year(incoming.get("year"))
-    if target_year is None and incoming_year is not None:
-        target["year"] = incoming_year
-    elif target_year is not None and incoming_year is not None:
-        target["year"] = min(target_year, incoming_year)
+    if incoming_year is not None:
+        target_year = coerce_year(target.get("year"))
+        target["year"] = incoming_year if target_year is None else min(target_year, incoming_year)
 
     if not target.get("doi") and incoming.get("doi"):
         target["doi"] = incoming["doi"]
@@ -1100,36 +1813,70 @@ def merge_papers(target: Dict[str, Any], incoming: Dict[str, Any]) -> None:
     if not target.get("url") and incoming.get("url"):
         target["url"] = incoming["url"]
 
-    append_unique(target["authors"], incoming.get("authors") or [])
-    append_unique(target["pdf_urls"], incoming.get("pdf_urls") or [])
-    append_unique(target["sources"], incoming.get("sources") or [])
-
-    source_ids = target.get("source_ids") or {}
-    for source, source_id in (incoming.get("source_ids") or {}).items():
-        source_ids.setdefault(source, source_id)
-    target["source_ids"] = source_ids
+    seen = target.get("_seen")
+    if seen is None:
+        seen = {field: set(target[field]) for field in MERGED_LIST_FIELDS}
+        target["_seen"] = seen
+    for field in MERGED_LIST_FIELDS:
+        values = incoming.get(field)
+        if values:
+            append_unique(target[field], seen[field], values)
+
+    incoming_source_ids = incoming.get("source_ids")
+    if incoming_source_ids:
+        source_ids = target.get("source_ids") or {}
+        for source, source_id in incoming_source_ids.items():
+            source_ids.setdefault(source, source_id)
+        target["source_ids"] = source_ids
+
+
+def _find_root(parent: Dict[int, int], record_id: int) -> int:
+    root = record_id
+    while parent[root] != root:
+        root = parent[root]
+    while parent[record_id] != root:
+        parent[record_id], record_id = root, parent[record_id]
+    return root
+
+
+def canonicalize_raw_papers(raw_papers: Sequence[Dict[str, Any]], *, jobs: int = 1) -> List[Dict[str, Any]]:
+    # Canonicalization is pure per-record CPU work, but shipping records to
+    # worker processes only pays off for large batches. Workers are spawned,
+    # not forked: prefetch threads from the collection phase may still be live.
+    if jobs > 1 and len(raw_papers) >= CANONICALIZE_PARALLEL_MIN_PAPERS:
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=jobs,
+                mp_context=multiprocessing.get_context("spawn"),
+            ) as pool:
+                results = list(pool.map(canonicalize_raw_paper, raw_papers, chunksize=CANONICALIZE_CHUNK_SIZE))
+            return [paper for paper in results if paper is not None]
+        except (OSError, concurrent.futures.BrokenExecutor) as exc:
+            logging.warning("Parallel canonicalization unavailable (%s); continuing serially", exc)
+    canonical_papers: List[Dict[str, Any]] = []
+    for raw in raw_papers:
+        canonical = canonicalize_raw_paper(raw)
+        if canonical is not None:
+            canonical_papers.append(canonical)
+    return canonical_papers
 
 
-def deduplicate_papers(raw_papers: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+def deduplicate_papers(raw_papers: Sequence[Dict[str, Any]], *, jobs: int = 1) -> List[Dict[str, Any]]:
     records: Dict[int, Dict[str, Any]] = {}
+    # Keys point at any record ever merged into a group; _find_root resolves
+    # the surviving record, so absorbing a record never rewrites key owners.
+    parent: Dict[int, int] = {}
     key_to_record: Dict[Tuple[str, str], int] = {}
     next_record_id = 1
 
-    for raw in raw_papers:
-        canonical = canonicalize_raw_paper(raw)
-        if canonical is None:
-            continue
-
+    for canonical in canonicalize_raw_papers(raw_papers, jobs=jobs):
         keys = dedup_keys(canonical)
-        matched = {
-            key_to_record[key]
-            for key in keys
-            if key in key_to_record and key_to_record[key] in records
-        }
+        matched = {_find_root(parent, key_to_record[key]) for key in keys if key in key_to_record}
 
         if not matched:
             record_id = next_record_id
             next_record_id += 1
+            parent[record_id] = record_id
             records[record_id] = canonical
         else:
             record_id = min(matched)
@@ -1137,9 +1884,7 @@ def deduplicate_papers(raw_papers: Sequence[Dict[str, Any]]) -> List[Dict[str, A
                 if other_id == record_id:
                     continue
                 merge_papers(records[record_id], records.pop(other_id))
-                for key, owner in list(key_to_record.items()):
-                    if owner == other_id:
-                        key_to_record[key] = record_id
+                parent[other_id] = record_id
             merge_papers(records[record_id], canonical)
 
         for key in dedup_keys(records[record_id]):
@@ -1149,8 +1894,6 @@ def deduplicate_papers(raw_papers: Sequence[Dict[str, Any]]) -> List[Dict[str, A
     for record_id in sorted(records):
         paper = records[record_id]
         paper["authors"] = normalize_authors(paper.get("authors") or [])
-        append_unique(paper["pdf_urls"], [])
-        append_unique(paper["sources"], [])
         paper["source_ids"] = dict(sorted((paper.get("source_ids") or {}).items()))
 
         if paper.get("doi"):
@@ -1159,40 +1902,81 @@ def deduplicate_papers(raw_papers: Sequence[Dict[str, Any]]) -> List[Dict[str, A
             paper_id = f"arxiv:{paper['arxiv_id']}"
         else:
             title_norm = paper.get("title_norm") or ""
-            digest = hashlib.sha1(title_norm.encode("utf-8", errors="ignore")).hexdigest()[:16]
+            digest = hashlib.blake2b(title_norm.encode("utf-8", errors="ignore"), digest_size=8).hexdigest()
             paper_id = f"title:{digest}"
 
         paper["paper_id"] = paper_id
         paper.pop("title_norm", None)
+        paper.pop("_seen", None)
         output.append(paper)
 
     return output
 
 
-def rewrite_known_pdf_urls(url: str) -> List[str]:
-    rewritten: List[str] = []
-    lowered = url.lower()
+ARXIV_ABS_RE = re.compile(r"/abs/([^?#]+)", re.IGNORECASE)
+# Landing pages are scanned as raw bytes; only the captured URLs are decoded.
+CITATION_PDF_RE = re.compile(rb"citation_pdf_url\s*['\"]\s*content=['\"]([^'\"]+)['\"]", re.IGNORECASE)
+HREF_PDF_RE = re.compile(rb"href=['\"]([^'\"]+\.pdf(?:\?[^'\"]*)?)['\"]", re.IGNORECASE)
 
+
+def _rewrite_arxiv(url: str, lowered: str) -> Optional[str]:
     if "arxiv.org/abs/" in lowered:
-        rewritten.append(re.sub(r"/abs/([^?#]+)", r"/pdf/\1.pdf", url, flags=re.IGNORECASE))
+        return ARXIV_ABS_RE.sub(r"/pdf/\1.pdf", url)
+    return None
+
+
+def _rewrite_openreview(url: str, lowered: str) -> Optional[str]:
     if "openreview.net/forum?id=" in lowered:
-        rewritten.append(url.replace("/forum?id=", "/pdf?id="))
-    if "openaccess.thecvf.com" in lowered and lowered.endswith(".html"):
-        rewritten.append(url[:-5] + ".pdf")
+        return url.replace("/forum?id=", "/pdf?id=")
+    return None
+
+
+def _rewrite_html_to_pdf(url: str, lowered: str) -> Optional[str]:
+    if lowered.endswith(".html"):
+        return url[:-5] + ".pdf"
+    return None
+
+
+def _rewrite_acl_anthology(url: str, lowered: str) -> Optional[str]:
     if "aclanthology.org/" in lowered and ".pdf" not in lowered:
-        rewritten.append(url.rstrip("/") + ".pdf")
-    if "proceedings.mlr.press" in lowered and lowered.endswith(".html"):
-        rewritten.append(url[:-5] + ".pdf")
-
-    cleaned: List[str] = []
-    for candidate in rewritten:
-        normalized = clean_url(candidate)
-        if normalized:
-            cleaned.append(normalized)
-    return cleaned
+        return url.rstrip("/") + ".pdf"
+    return None
+
+
+# Host (or parent domain) -> rewriter; each URL is dispatched on its hostname
+# instead of being scanned for every known host.
+PDF_URL_REWRITERS: Dict[str, Callable[[str, str], Optional[str]]] = {
+    "arxiv.org": _rewrite_arxiv,
+    "openreview.net": _rewrite_openreview,
+    "openaccess.thecvf.com": _rewrite_html_to_pdf,
+    "aclanthology.org": _rewrite_acl_anthology,
+    "proceedings.mlr.press": _rewrite_html_to_pdf,
+}
+
+
+def rewrite_known_pdf_urls(url: str) -> List[str]:
+    try:
+        host = parse.urlsplit(url).hostname or ""
+    except ValueError:
+        return []
+
+    labels = host.split(".")
+    for index in range(len(labels) - 1):
+        rewriter = PDF_URL_REWRITERS.get(".".join(labels[index:]))
+        if rewriter is None:
+            continue
+        candidate = clean_url(rewriter(url, url.lower()))
+        return [candidate] if candidate else []
+    return []
 
 
 def sniff_doi_pdf_urls(client: PoliteHttpClient, doi: str) -> List[str]:
+    cache_key = doi.lower()
+    with client.doi_pdf_urls_lock:
+        cached = client.doi_pdf_urls.get(cache_key)
+    if cached is not None:
+        return list(cached)
+
     doi_url = f"https://doi.org/{parse.quote(doi)}"
     try:
         response = client.request(
@@ -1210,28 +1994,24 @@ def sniff_doi_pdf_urls(client: PoliteHttpClient, doi: str) -> List[str]:
     if final_url and is_probably_pdf_url(final_url):
         candidates.append(final_url)
 
-    html_text = response.body.decode("utf-8", errors="replace")
-
-    for match in re.finditer(r"citation_pdf_url\s*['\"]\s*content=['\"]([^'\"]+)['\"]", html_text, re.IGNORECASE):
-        href = clean_url(parse.urljoin(response.url, match.group(1)))
-        if href:
-            candidates.append(href)
-
-    for match in re.finditer(r"href=['\"]([^'\"]+\.pdf(?:\?[^'\"]*)?)['\"]", html_text, re.IGNORECASE):
-        href = clean_url(parse.urljoin(response.url, match.group(1)))
-        if href:
-            candidates.append(href)
+    for pattern in (CITATION_PDF_RE, HREF_PDF_RE):
+        for match in pattern.finditer(response.body):
+            href = clean_url(parse.urljoin(response.url, match.group(1).decode("utf-8", errors="replace")))
+            if href:
+                candidates.append(href)
 
     deduped: List[str] = []
-    append_unique(deduped, candidates)
-    return deduped
+    append_unique(deduped, set(), candidates)
+    # Failed lookups are not cached so a later paper can retry the landing page.
+    with client.doi_pdf_urls_lock:
+        client.doi_pdf_urls[cache_key] = deduped
+    return list(deduped)
 
 
 def filename_slug(text: str, limit: int = 120) -> str:
-    normalized = normalize_title(text)
-    normalized = normalized.replace(" ", "-")
-    normalized = re.sub(r"[^a-z0-9\-]+", "", normalized)
-    normalized = normalized.strip("-")
+    # normalize_title already reduces text to single-space-separated [a-z0-9]
+    # words with no leading or trailing space, so only the separator changes.
+    normalized = normalize_title(text).replace(" ", "-")
     if not normalized:
         normalized = "paper"
     return normalized[:limit]
@@ -1241,18 +2021,48 @@ def unique_file_path(directory: Path, base_name: str, extension: str) -> Path:
     candidate = directory / f"{base_name}{extension}"
     if not candidate.exists():
         return candidate
-    counter = 2
-    while True:
-        candidate = directory / f"{base_name}-{counter}{extension}"
-        if not candidate.exists():
-            return candidate
-        counter += 1
+
+    def taken(counter: int) -> bool:
+        return (directory / f"{base_name}-{counter}{extension}").exists()
+
+    # Suffixes are handed out in order, so the taken ones form a run -2..-k.
+    # Double until a free suffix is found, then binary-search the boundary:
+    # O(log k) stats instead of k, same name as probing -2, -3, ... in turn.
+    low, high = 1, 2
+    while taken(high):
+        low, high = high, high * 2
+    while high - low > 1:
+        middle = (low + high) // 2
+        if taken(middle):
+            low = middle
+        else:
+            high = middle
+    return directory / f"{base_name}-{high}{extension}"
+
+
+def reserve_unique_file_path(directory: Path, base_name: str, extension: str) -> Path:
+    # Create the file while holding the lock so a concurrent worker cannot
+    # pick the same free name before it is written.
+    with OUTPUT_PATH_LOCK:
+        candidate = unique_file_path(directory, base_name, extension)
+        candidate.touch(exist_ok=False)
+    return candidate
+
+
+def move_or_copy_file(source: Path, destination: Path) -> None:
+    # Sources live in throwaway run directories, so a rename is enough;
+    # copy only when the two paths are on different filesystems.
+    try:
+        os.replace(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
 
 
 def unique_pdf_path(pdf_dir: Path, base_name: str) -> Path:
-    return unique_file_path(pdf_dir, base_name, ".pdf")
+    return reserve_unique_file_path(pdf_dir, base_name, ".pdf")
 
 
+@functools.lru_cache(maxsize=8)
 def resolve_mineru_cmd(configured_cmd: str) -> Optional[str]:
     candidates: List[str] = []
     if configured_cmd:
@@ -1286,14 +2096,35 @@ def parse_pdf_with_mineru(
     mineru_api_base: str,
     mineru_timeout: int,
 ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
-    run_name = filename_slug(f"{paper.get('paper_id', '')}-{pdf_path.stem}", limit=70)
-    hash_suffix = hashlib.sha1(str(pdf_path).encode("utf-8")).hexdigest()[:8]
-    run_dir = mineru_work_dir / f"{run_name}-{hash_suffix}"
-
-    if run_dir.exists():
+    # A fresh uniquely named directory per run: no pre-existence check, and
+    # concurrent MinerU workers can never share one.
+    run_dir = Path(tempfile.mkdtemp(prefix=f"{pdf_path.stem[:60]}-", dir=mineru_work_dir))
+    try:
+        return run_mineru_in_dir(
+            paper,
+            pdf_path=pdf_path,
+            run_dir=run_dir,
+            papers_dir=papers_dir,
+            mineru_cmd=mineru_cmd,
+            mineru_backend=mineru_backend,
+            mineru_api_base=mineru_api_base,
+            mineru_timeout=mineru_timeout,
+        )
+    finally:
         shutil.rmtree(run_dir, ignore_errors=True)
-    run_dir.mkdir(parents=True, exist_ok=True)
 
+
+def run_mineru_in_dir(
+    paper: Dict[str, Any],
+    *,
+    pdf_path: Path,
+    run_dir: Path,
+    papers_dir: Path,
+    mineru_cmd: str,
+    mineru_backend: str,
+    mineru_api_base: str,
+    mineru_timeout: int,
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
     command = [
         mineru_cmd,
         "--path",
@@ -1315,7 +2146,6 @@ def parse_pdf_with_mineru(
             timeout=mineru_timeout,
         )
     except subprocess.TimeoutExpired as exc:
-        shutil.rmtree(run_dir, ignore_errors=True)
         return None, {
             "paper_id": paper.get("paper_id"),
             "title": paper.get("title"),
@@ -1327,7 +2157,6 @@ def parse_pdf_with_mineru(
             "stdout_tail": clipped_text(decode_process_text(exc.stdout)),
         }
     except OSError as exc:
-        shutil.rmtree(run_dir, ignore_errors=True)
         return None, {
             "paper_id": paper.get("paper_id"),
             "title": paper.get("title"),
@@ -1338,7 +2167,6 @@ def parse_pdf_with_mineru(
         }
 
     if completed.returncode != 0:
-        shutil.rmtree(run_dir, ignore_errors=True)
         return None, {
             "paper_id": paper.get("paper_id"),
             "title": paper.get("title"),
@@ -1356,7 +2184,6 @@ def parse_pdf_with_mineru(
         reverse=True,
     )
     if not markdown_candidates:
-        shutil.rmtree(run_dir, ignore_errors=True)
         return None, {
             "paper_id": paper.get("paper_id"),
             "title": paper.get("title"),
@@ -1369,11 +2196,11 @@ def parse_pdf_with_mineru(
 
     markdown_source = markdown_candidates[0]
     destination_base = filename_slug(f"{paper.get('title', 'paper')}-{paper.get('paper_id', '')}")
-    destination = unique_file_path(papers_dir, destination_base, ".md")
+    destination = reserve_unique_file_path(papers_dir, destination_base, ".md")
     try:
-        shutil.copyfile(markdown_source, destination)
+        move_or_copy_file(markdown_source, destination)
     except OSError as exc:
-        shutil.rmtree(run_dir, ignore_errors=True)
+        destination.unlink(missing_ok=True)
         return None, {
             "paper_id": paper.get("paper_id"),
             "title": paper.get("title"),
@@ -1384,26 +2211,81 @@ def parse_pdf_with_mineru(
             "error": str(exc),
         }
 
-    shutil.rmtree(run_dir, ignore_errors=True)
     return str(Path("papers") / destination.name), None
 
 
+def probe_pdf_url(client: PoliteHttpClient, *, url: str, headers: Dict[str, str]) -> Optional[str]:
+    try:
+        response = client.request(url, headers=headers, method="HEAD")
+    except Exception as exc:
+        # Many publisher and CDN hosts reject HEAD but serve GET, so a failed
+        # probe is inconclusive; only a definite non-PDF type skips the GET.
+        logging.debug("PDF probe inconclusive: %s (%s)", url, exc)
+        return None
+
+    content_type = str(response.headers.get("Content-Type", "")).lower()
+    if not content_type or any(marker in content_type for marker in PDF_CONTENT_TYPE_MARKERS):
+        return None
+    return f"non_pdf_content_type:{content_type}"
+
+
 def attempt_single_pdf_download(
     client: PoliteHttpClient,
     *,
     url: str,
-    timeout_headers: Optional[Dict[str, str]] = None,
-) -> Optional[HttpResponse]:
+    pdf_dir: Path,
+    base_name: str,
+    min_pdf_bytes: int,
+    probe: bool = True,
+) -> Tuple[Optional[Path], Optional[str]]:
     headers = {
         "Accept": "application/pdf,application/octet-stream;q=0.9,*/*;q=0.8",
     }
-    if timeout_headers:
-        headers.update(timeout_headers)
+    # Landing pages and redirectors are far more common than PDFs behind
+    # extensionless URLs, so check those with a HEAD before fetching a body.
+    if probe and not is_probably_pdf_url(url):
+        probe_error = probe_pdf_url(client, url=url, headers=headers)
+        if probe_error:
+            return None, probe_error
+
+    part_paths: List[Path] = []
+
+    def write_part(response: StreamingHttpResponse) -> Tuple[str, bool, bytes, int]:
+        content_type = str(response.headers.get("Content-Type", "")).lower()
+        declared_pdf = "application/pdf" in content_type
+        head = b""
+        size = 0
+        with tempfile.NamedTemporaryFile(dir=pdf_dir, suffix=".part", delete=False) as handle:
+            part_paths.append(Path(handle.name))
+            for chunk in response.iter_chunks(PDF_STREAM_CHUNK_BYTES):
+                if len(head) < len(PDF_MAGIC):
+                    head += chunk[: len(PDF_MAGIC) - len(head)]
+                    if len(head) == len(PDF_MAGIC) and not declared_pdf and head != PDF_MAGIC:
+                        break
+                handle.write(chunk)
+                size += len(chunk)
+        return content_type, declared_pdf, head, size
+
     try:
-        return client.request(url, headers=headers)
+        content_type, declared_pdf, head, size = client.consume_stream(url, write_part, headers=headers)
+        if head != PDF_MAGIC and not declared_pdf:
+            return None, f"non_pdf_content_type:{content_type or 'unknown'}"
+        if size < min_pdf_bytes:
+            return None, f"too_small:{size}bytes"
+        destination = unique_pdf_path(pdf_dir, base_name)
+        try:
+            os.replace(part_paths[-1], destination)
+        except OSError:
+            destination.unlink(missing_ok=True)
+            raise
+        part_paths.pop()
+        return destination, None
     except Exception as exc:
         logging.debug("PDF download failed: %s (%s)", url, exc)
-        return None
+        return None, "request_failed"
+    finally:
+        for part_path in part_paths:
+            part_path.unlink(missing_ok=True)
 
 
 def download_pdf_for_paper(
@@ -1416,7 +2298,7 @@ def download_pdf_for_paper(
     attempted: List[Dict[str, str]] = []
 
     direct_urls: List[str] = []
-    append_unique(direct_urls, paper.get("pdf_urls") or [])
+    append_unique(direct_urls, set(), paper.get("pdf_urls") or [])
 
     arxiv_urls: List[str] = []
     if paper.get("arxiv_id"):
@@ -1435,14 +2317,17 @@ def download_pdf_for_paper(
         doi_urls = sniff_doi_pdf_urls(client, str(paper["doi"]))
 
     rewrite_urls: List[str] = []
+    rewrite_seen: Set[str] = set()
     rewrite_seeds: List[str] = []
-    append_unique(rewrite_seeds, direct_urls)
-    append_unique(rewrite_seeds, openreview_urls)
+    seed_seen: Set[str] = set()
+    append_unique(rewrite_seeds, seed_seen, direct_urls)
+    append_unique(rewrite_seeds, seed_seen, openreview_urls)
     if paper_url:
-        append_unique(rewrite_seeds, [paper_url])
+        append_unique(rewrite_seeds, seed_seen, [paper_url])
     for seed in rewrite_seeds:
-        append_unique(rewrite_urls, rewrite_known_pdf_urls(seed))
+        append_unique(rewrite_urls, rewrite_seen, rewrite_known_pdf_urls(seed))
 
+    base_name = filename_slug(f"{paper.get('title','paper')}-{paper.get('paper_id','')}")
     method_groups = [
         ("direct_oa", direct_urls),
         ("arxiv", arxiv_urls),
@@ -1453,43 +2338,22 @@ def download_pdf_for_paper(
 
     for method, urls in method_groups:
         deduped_urls: List[str] = []
-        append_unique(deduped_urls, [clean_url(url) or "" for url in urls])
+        append_unique(deduped_urls, set(), [clean_url(url) or "" for url in urls])
         for url in deduped_urls:
             if not url:
                 continue
-            response = attempt_single_pdf_download(client, url=url)
-            if response is None:
-                attempted.append({"method": method, "url": url, "error": "request_failed"})
-                continue
-
-            content_type = str(response.headers.get("Content-Type", "")).lower()
-            body = response.body
-            is_pdf = body.startswith(b"%PDF-") or "application/pdf" in content_type
-            if not is_pdf:
-                attempted.append(
-                    {
-                        "method": method,
-                        "url": url,
-                        "error": f"non_pdf_content_type:{content_type or 'unknown'}",
-                    }
-                )
-                continue
-
-            if len(body) < min_pdf_bytes:
-                attempted.append(
-                    {
-                        "method": method,
-                        "url": url,
-                        "error": f"too_small:{len(body)}bytes",
-                    }
-                )
+            destination, download_error = attempt_single_pdf_download(
+                client,
+                url=url,
+                pdf_dir=pdf_dir,
+                base_name=base_name,
+                min_pdf_bytes=min_pdf_bytes,
+                probe=method not in PDF_ENDPOINT_METHODS,
+            )
+            if destination is None:
+                attempted.append({"method": method, "url": url, "error": download_error or "request_failed"})
                 continue
-
-            base_name = filename_slug(f"{paper.get('title','paper')}-{paper.get('paper_id','')}")
-            destination = unique_pdf_path(pdf_dir, base_name)
-            destination.write_bytes(body)
-            relative_path = destination.name
-            return relative_path, None
+            return destination.name, None
 
     failure = {
         "paper_id": paper.get("paper_id"),
@@ -1500,52 +2364,70 @@ def download_pdf_for_paper(
     return None, failure
 
 
+def dumps_json_line(row: Dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(row, option=orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits; keep orjson's compact layout so
+            # lines within one file stay consistent.
+            line = json.dumps(row, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+            return (line + "\n").encode("utf-8")
+    line = json.dumps(row, ensure_ascii=False, sort_keys=True)
+    return (line + "\n").encode("utf-8")
+
+
 def write_jsonl(path: Path, rows: Sequence[Dict[str, Any]]) -> None:
-    with path.open("w", encoding="utf-8") as handle:
-        for row in rows:
-            handle.write(json.dumps(row, ensure_ascii=False, sort_keys=True))
-            handle.write("\n")
-
-
-def write_csv(path: Path, papers: Sequence[Dict[str, Any]]) -> None:
-    columns = [
-        "paper_id",
-        "title",
-        "year",
-        "venue",
-        "authors",
-        "doi",
-        "arxiv_id",
-        "url",
-        "sources",
-        "source_ids",
-        "pdf_urls",
-        "pdf_path",
-        "paper_md_path",
-        "abstract",
-    ]
-    with path.open("w", encoding="utf-8", newline="") as handle:
-        writer = csv.DictWriter(handle, fieldnames=columns)
-        writer.writeheader()
+    with path.open("wb") as handle:
+        handle.writelines(dumps_json_line(row) for row in rows)
+
+
+CSV_COLUMNS = (
+    "paper_id",
+    "title",
+    "year",
+    "venue",
+    "authors",
+    "doi",
+    "arxiv_id",
+    "url",
+    "sources",
+    "source_ids",
+    "pdf_urls",
+    "pdf_path",
+    "paper_md_path",
+    "abstract",
+)
+
+
+def csv_row(paper: Dict[str, Any]) -> Tuple[Any, ...]:
+    # Same order as CSV_COLUMNS.
+    return (
+        paper.get("paper_id", ""),
+        paper.get("title", ""),
+        paper.get("year", ""),
+        paper.get("venue", ""),
+        "; ".join(paper.get("authors") or []),
+        paper.get("doi", ""),
+        paper.get("arxiv_id", ""),
+        paper.get("url", ""),
+        "; ".join(paper.get("sources") or []),
+        json.dumps(paper.get("source_ids") or {}, ensure_ascii=False),
+        "; ".join(paper.get("pdf_urls") or []),
+        paper.get("pdf_path", ""),
+        paper.get("paper_md_path", ""),
+        paper.get("abstract", "") or "",
+    )
+
+
+def write_outputs(jsonl_path: Path, csv_path: Path, papers: Sequence[Dict[str, Any]]) -> None:
+    # One pass over the papers feeds both exports.
+    with jsonl_path.open("wb") as jsonl_handle, csv_path.open("w", encoding="utf-8", newline="") as csv_handle:
+        writer = csv.writer(csv_handle)
+        writer.writerow(CSV_COLUMNS)
         for paper in papers:
-            writer.writerow(
-                {
-                    "paper_id": paper.get("paper_id", ""),
-                    "title": paper.get("title", ""),
-                    "year": paper.get("year", ""),
-                    "venue": paper.get("venue", ""),
-                    "authors": "; ".join(paper.get("authors") or []),
-                    "doi": paper.get("doi", ""),
-                    "arxiv_id": paper.get("arxiv_id", ""),
-                    "url": paper.get("url", ""),
-                    "sources": "; ".join(paper.get("sources") or []),
-                    "source_ids": json.dumps(paper.get("source_ids") or {}, ensure_ascii=False),
-                    "pdf_urls": "; ".join(paper.get("pdf_urls") or []),
-                    "pdf_path": paper.get("pdf_path", ""),
-                    "paper_md_path": paper.get("paper_md_path", ""),
-                    "abstract": paper.get("abstract", "") or "",
-                }
-            )
+            jsonl_handle.write(dumps_json_line(paper))
+            writer.writerow(csv_row(paper))
 
 
 def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
@@ -1619,6 +2501,36 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=900,
         help="Timeout in seconds for one MinerU PDF parsing task.",
     )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=PDF_DOWNLOAD_WORKERS,
+        help="Number of papers whose PDFs are downloaded concurrently.",
+    )
+    parser.add_argument(
+        "--mineru-workers",
+        type=int,
+        default=MINERU_PARSE_WORKERS,
+        help="Number of MinerU parsing processes run concurrently; raise only if memory/GPU allow.",
+    )
+    parser.add_argument(
+        "--source-workers",
+        type=int,
+        default=SOURCE_FETCH_WORKERS,
+        help="Number of metadata sources queried concurrently (1 = sequential).",
+    )
+    parser.add_argument(
+        "--prefetch-pages",
+        type=int,
+        default=PAGE_PREFETCH_DEPTH,
+        help="Result-page requests kept in flight per paginated source while it keeps returning full pages (1 = sequential).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for normalizing large batches of raw records before dedup.",
+    )
     parser.add_argument(
         "--timeout",
         type=float,
@@ -1637,6 +2549,17 @@ def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
         default=1.0,
         help="Minimum interval (seconds) between requests per host.",
     )
+    parser.add_argument(
+        "--http-cache-dir",
+        default="",
+        help="Directory for caching source API JSON responses across runs (disabled when empty).",
+    )
+    parser.add_argument(
+        "--http-cache-ttl",
+        type=float,
+        default=HTTP_CACHE_TTL_SECONDS,
+        help="Maximum age in seconds of a cached API response before it is fetched again.",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -1658,30 +2581,51 @@ def collect_all_sources(
     max_per_source: int,
     venue_terms: Sequence[str],
     years: Optional[Set[int]],
+    source_workers: int = SOURCE_FETCH_WORKERS,
+    prefetch_pages: int = PAGE_PREFETCH_DEPTH,
 ) -> List[Dict[str, Any]]:
     raw_papers: List[Dict[str, Any]] = []
-    source_functions = [
-        ("OpenAlex", fetch_openalex),
-        ("Crossref", fetch_crossref),
-        ("Semantic Scholar", fetch_semantic_scholar),
-        ("OpenReview", fetch_openreview),
+    paging: Dict[str, Any] = {"prefetch_pages": prefetch_pages}
+    source_functions: List[Tuple[str, Callable[..., List[Dict[str, Any]]], Dict[str, Any]]] = [
+        ("OpenAlex", fetch_openalex, paging),
+        ("Crossref", fetch_crossref, paging),
+        ("Semantic Scholar", fetch_semantic_scholar, paging),
+        ("OpenReview", fetch_openreview, {}),
     ]
 
-    for source_name, fetcher in source_functions:
-        try:
+    # Each source lives on its own host, so fetching them concurrently only
+    # overlaps network waits; per-host throttling is unchanged. One worker
+    # falls back to querying the sources one after another.
+    papers_by_source: Dict[str, List[Dict[str, Any]]] = {}
+    max_workers = max(1, min(source_workers, len(source_functions)))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures: Dict[concurrent.futures.Future, str] = {}
+        for source_name, fetcher, extra_kwargs in source_functions:
             logging.info("Collecting from %s ...", source_name)
-            papers = fetcher(
+            future = pool.submit(
+                fetcher,
                 client,
                 query=query,
                 max_per_source=max_per_source,
                 venue_terms=venue_terms,
                 years=years,
+                **extra_kwargs,
             )
-            raw_papers.extend(papers)
+            futures[future] = source_name
+
+        for future in concurrent.futures.as_completed(futures):
+            source_name = futures[future]
+            try:
+                papers = future.result()
+            except Exception as exc:
+                logging.warning("%s collection failed: %s", source_name, exc)
+                continue
+            papers_by_source[source_name] = papers
             logging.info("%s returned %d filtered papers", source_name, len(papers))
-        except Exception as exc:
-            logging.warning("%s collection failed: %s", source_name, exc)
 
+    # Keep the fixed source order so deduplication stays deterministic.
+    for source_name, _, _ in source_functions:
+        raw_papers.extend(papers_by_source.get(source_name, []))
     return raw_papers
 
 
@@ -1695,6 +2639,8 @@ def download_pdfs(
     mineru_backend: str,
     mineru_api_base: str,
     mineru_timeout: int,
+    download_workers: int = PDF_DOWNLOAD_WORKERS,
+    mineru_workers: int = MINERU_PARSE_WORKERS,
 ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     pdf_dir = out_dir / "pdfs"
     papers_dir = out_dir / "papers"
@@ -1702,36 +2648,63 @@ def download_pdfs(
     pdf_dir.mkdir(parents=True, exist_ok=True)
     papers_dir.mkdir(parents=True, exist_ok=True)
     mineru_work_dir.mkdir(parents=True, exist_ok=True)
-    failed_downloads: List[Dict[str, Any]] = []
-    failed_mineru_parses: List[Dict[str, Any]] = []
+    download_failures: Dict[int, Dict[str, Any]] = {}
+    parse_failures: Dict[int, Dict[str, Any]] = {}
 
-    for index, paper in enumerate(papers, start=1):
-        logging.info("[%d/%d] Downloading PDF for: %s", index, len(papers), paper.get("title", ""))
-        relative_pdf_name, failure = download_pdf_for_paper(
+    def download(index: int, paper: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        logging.info("[%d/%d] Downloading PDF for: %s", index + 1, len(papers), paper.get("title", ""))
+        return download_pdf_for_paper(
             client,
             paper,
             pdf_dir=pdf_dir,
             min_pdf_bytes=min_pdf_bytes,
         )
-        if relative_pdf_name:
-            paper["pdf_path"] = str(Path("pdfs") / relative_pdf_name)
-            pdf_path = out_dir / paper["pdf_path"]
-            relative_md_path, parse_failure = parse_pdf_with_mineru(
-                paper,
-                pdf_path=pdf_path,
-                papers_dir=papers_dir,
-                mineru_work_dir=mineru_work_dir,
-                mineru_cmd=mineru_cmd,
-                mineru_backend=mineru_backend,
-                mineru_api_base=mineru_api_base,
-                mineru_timeout=mineru_timeout,
-            )
+
+    def parse(paper: Dict[str, Any]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        return parse_pdf_with_mineru(
+            paper,
+            pdf_path=out_dir / paper["pdf_path"],
+            papers_dir=papers_dir,
+            mineru_work_dir=mineru_work_dir,
+            mineru_cmd=mineru_cmd,
+            mineru_backend=mineru_backend,
+            mineru_api_base=mineru_api_base,
+            mineru_timeout=mineru_timeout,
+        )
+
+    # Downloads are network-bound and MinerU runs are subprocess-bound, so each
+    # gets its own pool; a paper is handed to MinerU as soon as its PDF lands.
+    # Per-host politeness is still enforced inside PoliteHttpClient.
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, download_workers)
+    ) as download_pool, concurrent.futures.ThreadPoolExecutor(
+        max_workers=max(1, mineru_workers)
+    ) as parse_pool:
+        download_futures = {
+            download_pool.submit(download, index, paper): index for index, paper in enumerate(papers)
+        }
+        parse_futures: Dict[concurrent.futures.Future, int] = {}
+        for future in concurrent.futures.as_completed(download_futures):
+            index = download_futures[future]
+            paper = papers[index]
+            relative_pdf_name, failure = future.result()
+            if relative_pdf_name:
+                paper["pdf_path"] = str(Path("pdfs") / relative_pdf_name)
+                parse_futures[parse_pool.submit(parse, paper)] = index
+            elif failure:
+                download_failures[index] = failure
+
+        for future in concurrent.futures.as_completed(parse_futures):
+            index = parse_futures[future]
+            relative_md_path, parse_failure = future.result()
             if relative_md_path:
-                paper["paper_md_path"] = relative_md_path
+                papers[index]["paper_md_path"] = relative_md_path
             elif parse_failure:
-                failed_mineru_parses.append(parse_failure)
-        elif failure:
-            failed_downloads.append(failure)
+                parse_failures[index] = parse_failure
+
+    # Report failures in input order regardless of completion order.
+    failed_downloads = [download_failures[index] for index in sorted(download_failures)]
+    failed_mineru_parses = [parse_failures[index] for index in sorted(parse_failures)]
     return failed_downloads, failed_mineru_parses
 
 
@@ -1746,12 +2719,19 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         ensure_positive_int("--max-per-source", int(args.max_per_source))
         ensure_positive_int("--min-pdf-bytes", int(args.min_pdf_bytes))
         ensure_positive_int("--mineru-timeout", int(args.mineru_timeout))
+        ensure_positive_int("--source-workers", int(args.source_workers))
+        ensure_positive_int("--prefetch-pages", int(args.prefetch_pages))
+        ensure_positive_int("--jobs", int(args.jobs))
+        ensure_positive_int("--download-workers", int(args.download_workers))
+        ensure_positive_int("--mineru-workers", int(args.mineru_workers))
         if args.timeout <= 0:
             raise ValueError("--timeout must be > 0")
         if args.retries <= 0:
             raise ValueError("--retries must be > 0")
         if args.min_interval < 0:
             raise ValueError("--min-interval must be >= 0")
+        if args.http_cache_ttl < 0:
+            raise ValueError("--http-cache-ttl must be >= 0")
         years = parse_years(args.years)
     except ValueError as exc:
         logging.error("Invalid arguments: %s", exc)
@@ -1769,6 +2749,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         retries=int(args.retries),
         min_interval=float(args.min_interval),
         user_agent="topconf-paper-collector/1.0 (public-metadata-collector)",
+        cache_dir=Path(args.http_cache_dir).expanduser().resolve() if args.http_cache_dir else None,
+        cache_ttl=float(args.http_cache_ttl),
     )
 
     raw_papers = collect_all_sources(
@@ -1777,10 +2759,12 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         max_per_source=int(args.max_per_source),
         venue_terms=venue_terms,
         years=years,
+        source_workers=int(args.source_workers),
+        prefetch_pages=int(args.prefetch_pages),
     )
     logging.info("Collected %d raw papers before dedup", len(raw_papers))
 
-    deduped_papers = deduplicate_papers(raw_papers)
+    deduped_papers = deduplicate_papers(raw_papers, jobs=int(args.jobs))
     logging.info("Retained %d papers after dedup", len(deduped_papers))
 
     failed_downloads: List[Dict[str, Any]] = []
@@ -1804,6 +2788,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             mineru_backend=str(args.mineru_backend),
             mineru_api_base=str(args.mineru_api_base),
             mineru_timeout=int(args.mineru_timeout),
+            download_workers=int(args.download_workers),
+            mineru_workers=int(args.mineru_workers),
         )
         logging.info(
             "PDF download finished: success=%d failed=%d",
@@ -1818,8 +2804,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     jsonl_path = out_dir / "papers.jsonl"
     csv_path = out_dir / "papers.csv"
-    write_jsonl(jsonl_path, deduped_papers)
-    write_csv(csv_path, deduped_papers)
+    write_outputs(jsonl_path, csv_path, deduped_papers)
 
     if args.download_pdf:
         write_jsonl(out_dir / "failed_downloads.jsonl", failed_downloads)